@@ -49,14 +49,22 @@ enum SortKey {
 }
 
 fn load_config_file_with_flag() -> (AppConfig, bool, PathBuf, ConfigSource) {
-    let (path, source) = resolve_config_path();
-    let existed = path.exists();
-    if let Ok(content) = fs::read_to_string(&path)
-        && let Ok(cfg) = toml::from_str::<AppConfig>(&content)
-    {
-        return (cfg, existed, path, source);
+    let (path, source, parsed) = resolve_config_path();
+    // A generic config.toml was already read and parsed while resolving
+    if let Some(cfg) = parsed {
+        return (cfg, true, path, source);
+    }
+    // The read doubles as the existence check (no separate stat)
+    match fs::read_to_string(&path) {
+        Ok(content) => {
+            let cfg = toml::from_str::<AppConfig>(&content).unwrap_or_default();
+            (cfg, true, path, source)
+        }
+        Err(e) => {
+            let existed = e.kind() != io::ErrorKind::NotFound;
+            (AppConfig::default(), existed, path, source)
+        }
     }
-    (AppConfig::default(), existed, path, source)
 }
 
 #[derive(Copy, Clone, Debug, Eq, PartialEq)]
@@ -71,50 +79,56 @@ enum Overlay {
     Insights,
 }
 
-fn print_help() {
-    println!(
-        "🌟 {} v{} - An optimized monitoring system linux",
-        NAME, VERSION
-    );
-    println!();
-    println!("USAGE:");
-    println!("    {} [OPTIONS]", NAME);
-    println!();
-    println!("OPTIONS:");
-    println!("    -h, --help       Show this help message");
-    println!("    -V, --version    Show version information");
-    println!();
-    println!("DESCRIPTION:");
-    println!("    Futuristic TUI system monitor with AI-powered insights");
-    println!("    - Real-time CPU, memory, network monitoring with charts");
-    println!("    - Process management with interactive controls");
-    println!("    - Three elite themes: Dark, Stellar, Matrix");
-    println!();
-    println!("EXAMPLES:");
-    println!("    {} --help       Show this help message", NAME);
-    println!();
-    println!();
-    println!("KEYBOARD SHORTCUTS:");
-    println!("    F1  Help         F6  Sort modes     F11 Export data");
-    println!("    F2  Setup        F7  Nice decrease  F12 AI Insights");
-    println!("    F3  Search       F8  Nice increase  ESC Close overlays");
-    println!("    F4  Filter       F9  Kill process   ");
-    println!("    F5  Charts toggle F10 Quit         Tab Cycle themes");
-    println!();
-    println!("CONFIGURATION:");
-    println!("    Precedence (highest to lowest):");
-    println!("      1) LYVOXA_CONFIG=/path/to/config.toml");
-    println!("      2) ./lyvoxa.toml | ./lyvoxa/config.toml | ./config/lyvoxa.toml");
-    println!("      3) ./config.toml (only if valid Lyvoxa AppConfig)");
-    println!("      4) /etc/lyvoxa/config.toml");
-    println!("      5) ~/.config/lyvoxa/config.toml (XDG)");
-    println!(
-        "    Session-only env overrides: LYVOXA_UI_MS, LYVOXA_DATA_MS, LYVOXA_ROWS, LYVOXA_SHOW_CHARTS"
-    );
-    println!("    Keys persist: Theme (Tab), Sort (F6), Charts (F5), Rows (from file)");
-    println!();
-    println!("REPOSITORY:");
-    println!("    https://github.com/oxyzenQ/lyvoxa");
+fn print_help() -> io::Result<()> {
+    use std::io::Write;
+
+    // Buffer the whole screen and emit it in one write instead of one
+    // line-buffered stdout write per line
+    let mut out = io::BufWriter::new(io::stdout().lock());
+    write!(
+        out,
+        "\
+🌟 {NAME} v{VERSION} - An optimized monitoring system linux
+
+USAGE:
+    {NAME} [OPTIONS]
+
+OPTIONS:
+    -h, --help       Show this help message
+    -V, --version    Show version information
+
+DESCRIPTION:
+    Futuristic TUI system monitor with AI-powered insights
+    - Real-time CPU, memory, network monitoring with charts
+    - Process management with interactive controls
+    - Three elite themes: Dark, Stellar, Matrix
+
+EXAMPLES:
+    {NAME} --help       Show this help message
+
+
+KEYBOARD SHORTCUTS:
+    F1  Help         F6  Sort modes     F11 Export data
+    F2  Setup        F7  Nice decrease  F12 AI Insights
+    F3  Search       F8  Nice increase  ESC Close overlays
+    F4  Filter       F9  Kill process   
+    F5  Charts toggle F10 Quit         Tab Cycle themes
+
+CONFIGURATION:
+    Precedence (highest to lowest):
+      1) LYVOXA_CONFIG=/path/to/config.toml
+      2) ./lyvoxa.toml | ./lyvoxa/config.toml | ./config/lyvoxa.toml
+      3) ./config.toml (only if valid Lyvoxa AppConfig)
+      4) /etc/lyvoxa/config.toml
+      5) ~/.config/lyvoxa/config.toml (XDG)
+    Session-only env overrides: LYVOXA_UI_MS, LYVOXA_DATA_MS, LYVOXA_ROWS, LYVOXA_SHOW_CHARTS
+    Keys persist: Theme (Tab), Sort (F6), Charts (F5), Rows (from file)
+
+REPOSITORY:
+    https://github.com/oxyzenQ/lyvoxa
+"
+    )?;
+    out.flush()
 }
 
 fn print_version() {
@@ -134,14 +148,14 @@ fn harden_process() {
 #[cfg(not(target_os = "linux"))]
 fn harden_process() {}
 
-#[tokio::main]
-async fn main() -> Result<(), Box<dyn Error>> {
-    // Handle command line arguments
+fn main() -> Result<(), Box<dyn Error>> {
+    // Handle command line arguments before the async runtime exists, so
+    // --help/--version return without spinning up tokio's worker threads
     let args: Vec<String> = env::args().collect();
     if args.len() > 1 {
         match args[1].as_str() {
             "-h" | "--help" => {
-                print_help();
+                print_help()?;
                 return Ok(());
             }
             "-V" | "--version" => {
@@ -155,6 +169,11 @@ async fn main() -> Result<(), Box<dyn Error>> {
             }
         }
     }
+    run_tui()
+}
+
+#[tokio::main]
+async fn run_tui() -> Result<(), Box<dyn Error>> {
     // Apply runtime hardening early
     harden_process();
     // Setup terminal
@@ -263,8 +282,7 @@ fn discover_config_candidates() -> Vec<(PathBuf, ConfigSource)> {
             ConfigSource::RepoConfigLyvoxaToml,
         );
         let generic = cwd.join("config.toml");
-        if generic.exists()
-            && let Ok(s) = fs::read_to_string(&generic)
+        if let Ok(s) = fs::read_to_string(&generic)
             && toml::from_str::<AppConfig>(&s).is_ok()
         {
             push_unique(generic, ConfigSource::RepoGenericToml);
@@ -295,10 +313,12 @@ fn discover_config_candidates() -> Vec<(PathBuf, ConfigSource)> {
     out
 }
 
-fn resolve_config_path() -> (PathBuf, ConfigSource) {
+// Also returns the parsed config when resolution had to read it (generic
+// config.toml), so the caller does not read and parse the file again
+fn resolve_config_path() -> (PathBuf, ConfigSource, Option<AppConfig>) {
     // Highest priority: explicit path via env
     if let Ok(p) = env::var("LYVOXA_CONFIG") {
-        return (PathBuf::from(p), ConfigSource::Env);
+        return (PathBuf::from(p), ConfigSource::Env, None);
     }
     // Next: project-local config (useful when running from repo)
     if let Ok(cwd) = env::current_dir() {
@@ -317,30 +337,26 @@ fn resolve_config_path() -> (PathBuf, ConfigSource) {
         ];
 
         for (cand, src) in candidates {
-            if cand.exists() {
-                if src == ConfigSource::RepoGenericToml {
-                    // Validate generic config.toml by parsing as AppConfig
-                    if let Ok(s) = fs::read_to_string(&cand) {
-                        if toml::from_str::<AppConfig>(&s).is_ok() {
-                            return (cand, src);
-                        } else {
-                            // Not a Lyvoxa config; skip
-                            continue;
-                        }
-                    } else {
-                        continue;
-                    }
-                } else {
-                    // lyvoxa.toml or lyvoxa/config.toml or config/lyvoxa.toml
-                    return (cand, src);
+            if src == ConfigSource::RepoGenericToml {
+                // Validate generic config.toml by parsing as AppConfig; read it
+                // directly (a missing file is just a failed read, no stat first)
+                if let Some(cfg) = fs::read_to_string(&cand)
+                    .ok()
+                    .and_then(|s| toml::from_str::<AppConfig>(&s).ok())
+                {
+                    return (cand, src, Some(cfg));
                 }
+                // Missing, unreadable, or not a Lyvoxa config; skip
+            } else if cand.exists() {
+                // lyvoxa.toml or lyvoxa/config.toml or config/lyvoxa.toml
+                return (cand, src, None);
             }
         }
     }
     // System-wide fallback (enterprise use)
     let sys = PathBuf::from("/etc/lyvoxa/config.toml");
     if sys.exists() {
-        return (sys, ConfigSource::System);
+        return (sys, ConfigSource::System, None);
     }
     // Fallback: XDG Base Directory spec
     let base = env::var("XDG_CONFIG_HOME")
@@ -355,7 +371,7 @@ fn resolve_config_path() -> (PathBuf, ConfigSource) {
     let mut p = base;
     p.push("lyvoxa");
     p.push("config.toml");
-    (p, ConfigSource::Xdg)
+    (p, ConfigSource::Xdg, None)
 }
 
 fn save_config_file_at(path: &Path, cfg: &AppConfig) -> io::Result<()> {
@@ -557,12 +573,19 @@ impl App {
             return;
         }
         let (path, source) = self.setup_sources[self.setup_selected].clone();
-        // If file exists, try load; if not, create from current config
-        if path.exists() {
-            match fs::read_to_string(&path)
-                .ok()
-                .and_then(|s| toml::from_str::<AppConfig>(&s).ok())
-            {
+        // If file exists, try load; if not, create from current config.
+        // NotFound from the read is the existence check (no separate stat).
+        let content = match fs::read_to_string(&path) {
+            Ok(s) => Some(s),
+            Err(e) if e.kind() == io::ErrorKind::NotFound => None,
+            Err(e) => {
+                self.status_message =
+                    Some(format!("Cannot read config: {} ({})", path.display(), e));
+                return;
+            }
+        };
+        if let Some(s) = content {
+            match toml::from_str::<AppConfig>(&s).ok() {
                 Some(cfg) => {
                     self.config = cfg;
                     self.config_path = path;